@@ -1,22 +1,25 @@
 """Command-line interface"""
 
 import logging
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import Annotated, Dict, Optional
+from typing import Annotated, List, Optional, Type
 
 import typer
 from rich.progress import track
 
-from .engine import Game, GameOptions
-from .strategy import AlwaysHit, Basic, Manual, Training
+from .engine import Game, GameOptions, GameStats
+from .strategy import AlwaysHit, Basic, Manual, Strategy, Training
 
 logger = logging.getLogger(__name__)
 
 app = typer.Typer(add_completion=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class CommonOptions:
     game_options: GameOptions
     bankroll: int
@@ -26,11 +29,28 @@ class PlayerStrategy(StrEnum):
     Basic = "basic"
     AlwaysHit = "always_hit"
 
+    @property
+    def strategy_cls(self) -> Type[Strategy]:
+        match self:
+            case PlayerStrategy.Basic:
+                return Basic
+            case PlayerStrategy.AlwaysHit:
+                return AlwaysHit
 
-_STRATEGY_MAP: Dict = {
-    PlayerStrategy.Basic: Basic,
-    PlayerStrategy.AlwaysHit: AlwaysHit,
-}
+
+_SIMULATE_NUM_BATCHES = 100
+
+
+def _play_batch(
+    player_strategy: PlayerStrategy,
+    game_options: GameOptions,
+    bankroll: int,
+    num_games: int,
+    seed: Optional[int],
+) -> GameStats:
+    """Play a batch of simulated games, run in a worker process"""
+    game = Game(options=game_options, seed=seed)
+    return game.play_many(player_strategy.strategy_cls(), bankroll, num_games)
 
 
 @app.command()
@@ -50,8 +70,7 @@ def play(
     An optional training strategy can be specified to compare with user decisions.
     """
     if training_strategy:
-        strategy_cls = _STRATEGY_MAP[training_strategy]
-        strategy = Training(strategy_cls())
+        strategy = Training(training_strategy.strategy_cls())
     else:
         strategy = Manual()
 
@@ -59,8 +78,8 @@ def play(
     bankroll, ev = game.play(strategy, ctx.obj.bankroll)
 
     logger.info("\n~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-    logger.info(f"Final Bankroll: ${bankroll}")
-    logger.info(f"House Edge: {-100.0 * ev:.2f}%")
+    logger.info("Final Bankroll: $%s", bankroll)
+    logger.info("House Edge: %.2f%%", -100.0 * ev)
 
 
 @app.command()
@@ -72,22 +91,48 @@ def simulate(
     num_games: Annotated[
         int, typer.Option(help="Number of games to simulate")
     ] = 1000000,
+    num_workers: Annotated[
+        int, typer.Option(min=1, help="Number of worker processes running games")
+    ] = os.cpu_count() or 1,
+    seed: Annotated[
+        Optional[int], typer.Option(help="Random seed for a reproducible simulation")
+    ] = None,
 ):
-    """Simulate many blackjack games to evaluate a strategy"""
-    strategy_cls = _STRATEGY_MAP[player_strategy]
+    """Simulate many blackjack games to evaluate a strategy
 
-    avg_ev = 0.0
-    num_bankrupt = 0
-    for _ in track(range(num_games), description="Running simulation"):
-        game = Game(options=ctx.obj.game_options)
-        bankroll, ev = game.play(strategy_cls(), ctx.obj.bankroll)
-        if bankroll == 0:
-            num_bankrupt += 1
-
-        avg_ev += ev
-
-    logger.info(f"Risk of Ruin: {(num_bankrupt / num_games) * 100.0:.2f}%")
-    logger.info(f"House Edge: {-100.0 * (avg_ev / num_games):.2f}%")
+    Games are independent, so batches of games are spread across worker
+    processes. Progress is tracked per batch. Each batch gets its own seed
+    derived from the simulation seed, so results do not depend on which
+    worker plays which batch.
+    """
+    batch_size = max(num_games // _SIMULATE_NUM_BATCHES, 1)
+    batches = [batch_size] * (num_games // batch_size)
+    if num_games % batch_size:
+        batches.append(num_games % batch_size)
+
+    seeds: List[Optional[int]] = [None] * len(batches)
+    if seed is not None:
+        rng = random.Random(seed)
+        seeds = [rng.getrandbits(64) for _ in batches]
+
+    stats = GameStats()
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        results = executor.map(
+            _play_batch,
+            [player_strategy] * len(batches),
+            [ctx.obj.game_options] * len(batches),
+            [ctx.obj.bankroll] * len(batches),
+            batches,
+            seeds,
+        )
+        for batch_stats in track(
+            results, total=len(batches), description="Running simulation"
+        ):
+            stats.merge(batch_stats)
+
+    logger.info("Risk of Ruin: %.2f%%", stats.risk_of_ruin() * 100.0)
+    logger.info("House Edge: %.2f%%", -100.0 * stats.mean_ev())
+    logger.info("Hands Played: %d", stats.num_hands)
 
 
 @app.callback()
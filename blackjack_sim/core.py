@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass
 from enum import StrEnum
-from typing import List, Tuple
+from typing import Iterable, List, Self, SupportsIndex
 
 
 class Action(StrEnum):
@@ -13,10 +13,11 @@ class Action(StrEnum):
     SPLIT = "S[p]lit"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Card:
     name: str
     value: int
+    rank: int
 
     def __repr__(self) -> str:
         return self.name
@@ -26,11 +27,30 @@ class Card:
 
 
 class Hand(List[Card]):
+    __slots__ = ("_aces", "_name", "_soft_aces", "_surrender", "_value", "_wager")
+
     def __init__(self, cards: List[Card], name: str = "", wager: int = 0):
         self._name = name
         self._wager = wager
         self._surrender = False
-        super().__init__(cards)
+
+        # Value is kept up to date as cards are added, see append()
+        self._value = 0
+        self._aces = 0
+        self._soft_aces = 0
+        super().__init__()
+        for card in cards:
+            self.append(card)
+
+    def reset(self, name: str = "", wager: int = 0):
+        """Empty the hand so it can be reused, as if newly constructed"""
+        self._name = name
+        self._wager = wager
+        self._surrender = False
+        self._value = 0
+        self._aces = 0
+        self._soft_aces = 0
+        super().clear()
 
     def __repr__(self) -> str:
         prefix = self._name + ": " if self._name else ""
@@ -44,32 +64,85 @@ class Hand(List[Card]):
     def wager(self) -> int:
         return self._wager
 
-    def _value(self) -> Tuple[int, bool]:
-        value = sum([c.value for c in self])
-        ace_count = sum([c.is_ace() for c in self])
-        while value > 21 and ace_count:
-            value -= 10
-            ace_count -= 1
-
-        return value, (ace_count > 0)
+    def append(self, card: Card):
+        self._value += card.value
+        if card.is_ace():
+            self._aces += 1
+            self._soft_aces += 1
+
+        # Count aces as 1 instead of 11 until the hand is no longer bust
+        while self._value > 21 and self._soft_aces:
+            self._value -= 10
+            self._soft_aces -= 1
+
+        super().append(card)
+
+    # The other list mutators keep the cached value in sync with the cards,
+    # adding through append() or recomputing it from scratch
+    def _recompute_value(self):
+        cards = list(self)
+        super().clear()
+        self._value = 0
+        self._aces = 0
+        self._soft_aces = 0
+        for card in cards:
+            self.append(card)
+
+    def extend(self, cards: Iterable[Card]):
+        for card in cards:
+            self.append(card)
+
+    def __iadd__(self, cards: Iterable[Card]) -> Self:
+        self.extend(cards)
+        return self
+
+    def insert(self, index: SupportsIndex, card: Card):
+        super().insert(index, card)
+        self._recompute_value()
+
+    def pop(self, index: SupportsIndex = -1) -> Card:
+        card = super().pop(index)
+        self._recompute_value()
+        return card
+
+    def remove(self, card: Card):
+        super().remove(card)
+        self._recompute_value()
+
+    def clear(self):
+        super().clear()
+        self._recompute_value()
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self._recompute_value()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self._recompute_value()
+
+    def __imul__(self, count: SupportsIndex) -> Self:
+        super().__imul__(count)
+        self._recompute_value()
+        return self
 
     def value(self) -> int:
-        return self._value()[0]
+        return self._value
 
     def is_soft(self) -> bool:
-        return self._value()[1]
+        return self._soft_aces > 0
 
     def has_ace(self) -> bool:
-        return any(c.is_ace() for c in self)
+        return self._aces > 0
 
     def is_bust(self) -> bool:
-        return self.value() > 21
+        return self._value > 21
 
     def is_blackjack(self) -> bool:
-        return self.value() == 21
+        return self._value == 21
 
     def can_split(self) -> bool:
-        return (len(self) == 2) and (self[0].name[0] == self[1].name[0])
+        return (len(self) == 2) and (self[0].rank == self[1].rank)
 
     def double(self):
         self._wager *= 2
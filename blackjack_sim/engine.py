@@ -2,51 +2,90 @@
 
 import random
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
 from .core import Action, Card, Hand
-from .strategy import Dealer, Strategy
+from .strategy import Strategy
 
 
 class EmptyShoeError(IndexError): ...
 
 
+# Bits for the optional actions, indexing every legal combination of actions
+_CAN_SURRENDER = 1 << 0
+_CAN_DOUBLE = 1 << 1
+_CAN_SPLIT = 1 << 2
+
+_ACTIONS: Tuple[FrozenSet[Action], ...] = tuple(
+    frozenset(
+        action
+        for action, flag in [
+            (Action.HIT, 0),
+            (Action.STAND, 0),
+            (Action.SURRENDER, _CAN_SURRENDER),
+            (Action.DOUBLE, _CAN_DOUBLE),
+            (Action.SPLIT, _CAN_SPLIT),
+        ]
+        if (flags & flag) == flag
+    )
+    for flags in range(8)
+)
+
+
 class Shoe(List[Card]):
     _SUITS = ["\u2660\ufe0f", "\u2665\ufe0f", "\u2666\ufe0f", "\u2663\ufe0f"]
     _FACES = ["2", "3", "4", "5", "6", "7", "8", "9", "T", "J", "Q", "K", "A"]
 
-    def __init__(self, num_decks: int):
+    # Cards are immutable, so every shoe shares the same 52 instances
+    _DECK: Tuple[Card, ...] = ()
+
+    def __init__(self, num_decks: int, rng: Optional[random.Random] = None):
         self._num_cards = num_decks * 52
+        self._rng = rng if rng else random.Random()
+
+        if not Shoe._DECK:
+            Shoe._DECK = self._make_deck()
+
+        super().__init__(self._DECK * num_decks)
+        self.shuffle()
+
+    def shuffle(self):
+        """Return all drawn cards to the shoe and shuffle it in place"""
+        self._rng.shuffle(self)
+
+        # Cards are drawn from the end of the shoe without removing them
+        self._cursor = len(self)
 
+    @classmethod
+    def _make_deck(cls) -> Tuple[Card, ...]:
         cards = []
-        for _ in range(num_decks):
-            for suit in self._SUITS:
-                for face in self._FACES:
-                    if face == "A":
-                        value = 11
-                    elif face in ["T", "J", "Q", "K"]:
-                        value = 10
-                    else:
-                        value = int(face)
+        for suit in cls._SUITS:
+            for rank, face in enumerate(cls._FACES):
+                if face == "A":
+                    value = 11
+                elif face in ["T", "J", "Q", "K"]:
+                    value = 10
+                else:
+                    value = int(face)
 
-                    cards.append(Card(f"{face}{suit}", value))
+                cards.append(Card(f"{face}{suit}", value, rank))
 
-        super().__init__(cards)
-        random.shuffle(self)
+        return tuple(cards)
 
     def percent_full(self) -> float:
-        return (len(self) / self._num_cards) * 100.0
+        return (self._cursor / self._num_cards) * 100.0
 
     def draw(self) -> Card:
-        try:
-            return self.pop()
-        except IndexError:
+        if not self._cursor:
             raise EmptyShoeError(
                 "Empty shoe: Increase num decks or min shoe percent to avoid this"
             )
 
+        self._cursor -= 1
+        return self[self._cursor]
 
-@dataclass
+
+@dataclass(slots=True)
 class GameOptions:
     min_bet: int = 10
     payout: float = 1.5
@@ -58,18 +97,75 @@ class GameOptions:
     max_split: int = 2
 
 
+@dataclass(slots=True)
+class GameStats:
+    """Results accumulated over many games"""
+
+    num_games: int = 0
+    num_bankrupt: int = 0
+    num_hands: int = 0
+    ev_sum: float = 0.0
+    ev_squared_sum: float = 0.0
+
+    def add(self, bankroll: float, ev: float, num_hands: int = 0):
+        self.num_games += 1
+        self.num_bankrupt += bankroll == 0
+        self.num_hands += num_hands
+        self.ev_sum += ev
+        self.ev_squared_sum += ev * ev
+
+    def merge(self, other: "GameStats"):
+        self.num_games += other.num_games
+        self.num_bankrupt += other.num_bankrupt
+        self.num_hands += other.num_hands
+        self.ev_sum += other.ev_sum
+        self.ev_squared_sum += other.ev_squared_sum
+
+    def risk_of_ruin(self) -> float:
+        return self.num_bankrupt / self.num_games if self.num_games else 0.0
+
+    def mean_ev(self) -> float:
+        return self.ev_sum / self.num_games if self.num_games else 0.0
+
+    def ev_variance(self) -> float:
+        if not self.num_games:
+            return 0.0
+
+        mean = self.mean_ev()
+        return max(self.ev_squared_sum / self.num_games - mean * mean, 0.0)
+
+
 class Game:
-    def __init__(self, options: Optional[GameOptions] = None):
+    def __init__(
+        self, options: Optional[GameOptions] = None, seed: Optional[int] = None
+    ):
         # Game config
         self._options = GameOptions() if not options else options
+        self._rng = random.Random(seed)
 
         # Game state
         self._bankroll = 0.0
         self._total_bet = 0
+        self._num_hands = 0
         self._shoe: Optional[Shoe] = None
         self._strategy: Optional[Strategy] = None
+        self._verbose = False
         self._upcard: Optional[int] = None
 
+        # Hands are recycled between rounds to avoid allocating new ones
+        self._hand_pool: List[Hand] = []
+
+    def _acquire_hand(self, name: str, wager: int = 0) -> Hand:
+        if self._hand_pool:
+            hand = self._hand_pool.pop()
+            hand.reset(name=name, wager=wager)
+            return hand
+
+        return Hand([], name=name, wager=wager)
+
+    def _release_hands(self, hands: List[Hand]):
+        self._hand_pool += hands
+
     def _make_bet(self, bet: int):
         assert self._bankroll >= bet
 
@@ -83,84 +179,110 @@ class Game:
         hand.append(card)
         if is_upcard:
             self._upcard = card.value
-        if show_hand and self._strategy:
+        if show_hand and self._verbose:
+            assert self._strategy
             self._strategy.show_hand(hand)
 
     def _play_hand(
         self, strategy: Strategy, hand: Hand, bet: int, num_split: int
     ) -> List[Hand]:
-        actions = [Action.HIT, Action.STAND]
-        if len(hand) == 2:
-            if self._options.late_surrender and (num_split == 0):
-                actions.append(Action.SURRENDER)
-
-            if self._bankroll >= bet:
-                if self._options.double_after_split or (num_split == 0):
-                    actions.append(Action.DOUBLE)
-
-                if hand.can_split() and (num_split < self._options.max_split):
-                    actions.append(Action.SPLIT)
+        while True:
+            flags = 0
+            if len(hand) == 2:
+                if self._options.late_surrender and (num_split == 0):
+                    flags |= _CAN_SURRENDER
+
+                if self._bankroll >= bet:
+                    if self._options.double_after_split or (num_split == 0):
+                        flags |= _CAN_DOUBLE
+
+                    if hand.can_split() and (num_split < self._options.max_split):
+                        flags |= _CAN_SPLIT
+
+            actions = _ACTIONS[flags]
+            action = strategy.get_action(hand, actions, upcard=self._upcard)
+            assert action in actions, f"Invalid action: {action}"
+
+            if action == Action.HIT:
+                self._draw_card(hand)
+                if hand.is_bust() or hand.is_blackjack():
+                    break
+            elif action == Action.STAND:
+                break
+            elif action == Action.SURRENDER:
+                hand.surrender()
+                break
+            elif action == Action.DOUBLE:
+                self._make_bet(bet)
+                self._draw_card(hand)
+                hand.double()
+                break
+            elif action == Action.SPLIT:
+                # Only splitting branches into more hands, so only it recurses
+                self._make_bet(bet)
+                new_hands = []
+                for i in range(2):
+                    new_hand = self._acquire_hand(f"{hand.name} Split {i + 1}", bet)
+                    new_hand.append(hand[i])
+                    self._draw_card(new_hand)
+                    if hand.has_ace():
+                        # Game rule: Must stand after splitting Aces
+                        new_hands.append(new_hand)
+                    else:
+                        new_hands += self._play_hand(
+                            strategy, new_hand, bet, num_split + 1
+                        )
 
-        action = strategy.get_action(hand, actions, upcard=self._upcard)
-        assert action in actions, f"Invalid action: {action}"
+                self._release_hands([hand])
+                return new_hands
 
-        if action == Action.HIT:
-            self._draw_card(hand)
-            if not (hand.is_bust() or hand.is_blackjack()):
-                return self._play_hand(strategy, hand, bet, num_split)
-        elif action == Action.STAND:
-            pass
-        elif action == Action.SURRENDER:
-            hand.surrender()
-        elif action == Action.DOUBLE:
-            self._make_bet(bet)
-            self._draw_card(hand)
-            hand.double()
-        elif action == Action.SPLIT:
-            self._make_bet(bet)
-            new_hands = []
-            for i in range(2):
-                new_hand = Hand([hand[i]], name=f"{hand.name} Split {i + 1}", wager=bet)
-                self._draw_card(new_hand)
-                if hand.has_ace():
-                    # Game rule: Must stand after splitting Aces
-                    new_hands.append(new_hand)
-                else:
-                    new_hands += self._play_hand(strategy, new_hand, bet, num_split + 1)
+            else:
+                raise AssertionError(f"Invalid action: {action}")
 
-            return new_hands
+        return [hand]
 
-        else:
-            raise AssertionError(f"Invalid action: {action}")
+    def _play_dealer(self, hand: Hand):
+        # Same rules as the Dealer strategy, without dispatching each decision
+        hit_soft_seventeen = self._options.hit_soft_seventeen
+        while True:
+            value = hand.value()
+            if value > 17 or (
+                value == 17 and not (hit_soft_seventeen and hand.is_soft())
+            ):
+                break
 
-        return [hand]
+            self._draw_card(hand)
 
     def _compare_hands(self, player_hand: Hand, dealer_hand: Hand):
         assert self._strategy
 
         if player_hand.is_bust():
-            self._strategy.show_result(player_hand, "Player bust")
+            result = "Player bust"
         elif dealer_hand.is_bust():
-            self._strategy.show_result(player_hand, "Dealer bust")
+            result = "Dealer bust"
             self._bankroll += 2.0 * player_hand.wager
         else:
             pv = player_hand.value()
             dv = dealer_hand.value()
             if pv > dv:
-                self._strategy.show_result(player_hand, f"Player wins ({pv} > {dv})")
+                result = f"Player wins ({pv} > {dv})"
                 self._bankroll += 2.0 * player_hand.wager
             elif pv == dv:
-                self._strategy.show_result(player_hand, f"Push ({pv} = {dv})")
+                result = f"Push ({pv} = {dv})"
                 self._bankroll += player_hand.wager
             else:
-                self._strategy.show_result(player_hand, f"Dealer wins ({pv} < {dv})")
+                result = f"Dealer wins ({pv} < {dv})"
+
+        if self._verbose:
+            self._strategy.show_result(player_hand, result)
 
     def _play_round(self, bet: int):
         assert self._strategy
 
         # Deal initial hands
-        player_hand = Hand([], name="Player", wager=bet)
-        dealer_hand = Hand([], name="Dealer")
+        player_hand = self._acquire_hand("Player", bet)
+        dealer_hand = self._acquire_hand("Dealer")
+        player_hands = [player_hand]
         self._draw_card(player_hand, show_hand=False)
         self._draw_card(dealer_hand, is_upcard=True)
         self._draw_card(player_hand)
@@ -168,41 +290,65 @@ class Game:
 
         # Check for natural blackjack before any play
         if player_hand.is_blackjack() or dealer_hand.is_blackjack():
-            self._strategy.show_hand(dealer_hand)
             if player_hand.is_blackjack() and dealer_hand.is_blackjack():
-                self._strategy.show_result(player_hand, "Push (blackjack)")
+                result = "Push (blackjack)"
                 self._bankroll += bet
             elif player_hand.is_blackjack() and not dealer_hand.is_blackjack():
-                self._strategy.show_result(player_hand, "Player has blackjack")
+                result = "Player has blackjack"
                 self._bankroll += bet + (self._options.payout * bet)
             else:
-                self._strategy.show_result(player_hand, "Dealer has blackjack")
+                result = "Dealer has blackjack"
+
+            if self._verbose:
+                self._strategy.show_hand(dealer_hand)
+                self._strategy.show_result(player_hand, result)
         else:
             # Player plays one or more hands
             player_hands = self._play_hand(self._strategy, player_hand, bet, 0)
 
             # Check for surrender before dealer plays
             if (len(player_hands) == 1) and player_hands[0].is_surrender():
-                self._strategy.show_result(player_hand, "Player surrender")
+                if self._verbose:
+                    self._strategy.show_result(player_hand, "Player surrender")
                 self._bankroll += 0.5 * bet
             else:
                 # Dealer plays their hand
-                self._strategy.show_hand(dealer_hand)
-                dealer = Dealer(self._options.hit_soft_seventeen)
-                dealer_hands = self._play_hand(dealer, dealer_hand, 0, 0)
-                assert len(dealer_hands) == 1
-                dealer_hand = dealer_hands[0]
+                if self._verbose:
+                    self._strategy.show_hand(dealer_hand)
+
+                self._play_dealer(dealer_hand)
 
                 # Compare outcomes, adjust bankroll (no change if dealer wins)
                 for player_hand in player_hands:
                     self._compare_hands(player_hand, dealer_hand)
 
+        self._num_hands += len(player_hands)
+        self._release_hands(player_hands + [dealer_hand])
+
+    def reset(self):
+        """Clear game state, reusing the same shoe for the next game"""
+        self._bankroll = 0.0
+        self._total_bet = 0
+        self._num_hands = 0
+        self._upcard = None
+        if self._shoe:
+            self._shoe.shuffle()
+        else:
+            self._shoe = Shoe(self._options.num_decks, rng=self._rng)
+
     def play(self, strategy: Strategy, bankroll: int) -> Tuple[float, float]:
+        self.reset()
+        assert self._shoe
         self._bankroll = bankroll
-        self._total_bet = 0
-        self._shoe = Shoe(self._options.num_decks)
         self._strategy = strategy
 
+        # Skip display callbacks entirely for strategies that ignore them
+        strategy_cls = type(strategy)
+        self._verbose = any(
+            getattr(strategy_cls, name, None) is not getattr(Strategy, name)
+            for name in ["show_hand", "show_result"]
+        )
+
         while True:
             bet = strategy.get_bet(self._options.min_bet, self._bankroll)
             if (
@@ -220,3 +366,21 @@ class Game:
 
         ev = (self._bankroll - bankroll) / self._total_bet if self._total_bet else 0.0
         return self._bankroll, ev
+
+    def play_many(self, strategy: Strategy, bankroll: int, num_games: int) -> GameStats:
+        """Play many independent games, each from the same starting bankroll
+
+        Args:
+            strategy: Strategy used for every game
+            bankroll: Starting bankroll of each game
+            num_games: Number of games to play
+
+        Returns:
+            Risk of ruin, expected value and player hand count over all games
+        """
+        stats = GameStats()
+        for _ in range(num_games):
+            bankroll_end, ev = self.play(strategy, bankroll)
+            stats.add(bankroll_end, ev, self._num_hands)
+
+        return stats
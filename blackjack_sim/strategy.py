@@ -3,16 +3,49 @@
 import logging
 import re
 from abc import abstractmethod
-from typing import List, Optional
+from functools import lru_cache
+from typing import Callable, Collection, Dict, FrozenSet, List, Optional, Tuple
 
 from .core import Action, Hand
 
 logger = logging.getLogger(__name__)
 
+_ACTION_SHORT_FORM_RE = re.compile(r"\[(.*?)\]")
+
+
+def _parse_action_forms(action: Action) -> Tuple[str, str]:
+    """Long form (e.g. "hit") and short form (e.g. "h") of an action's user input"""
+    action_str = str(action).lower()
+    match = _ACTION_SHORT_FORM_RE.search(action_str)
+    assert match
+    return action_str.replace("[", "").replace("]", ""), match.group(1)
+
+
+_ACTION_FORMS: Dict[Action, Tuple[str, str]] = {
+    action: _parse_action_forms(action) for action in Action
+}
+
+
+@lru_cache
+def _action_prompt(actions: FrozenSet[Action]) -> Tuple[str, Dict[str, Action]]:
+    """Prompt text and accepted user inputs for a set of available actions"""
+    # Prompt actions in definition order, regardless of the set's order
+    ordered = [a for a in Action if a in actions]
+
+    valid_inputs = {}
+    for action in ordered:
+        long_form, short_form = _ACTION_FORMS[action]
+        valid_inputs[long_form] = action
+        valid_inputs[short_form] = action
+
+    return " ".join([str(a) for a in ordered]), valid_inputs
+
 
 class Strategy:
     """Interface between game engine and strategy implementations"""
 
+    __slots__ = ()
+
     def show_hand(self, hand: Hand):
         """Called when a hand is updated with a new, visible card
 
@@ -44,13 +77,13 @@ class Strategy:
 
     @abstractmethod
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         """Specify what action to take during a hand of blackjack
 
         Args:
             hand: Current hand being played
-            actions: List of available actions
+            actions: Available actions
             upcard: Dealer upcard
 
         Return:
@@ -62,17 +95,19 @@ class Strategy:
 class Manual(Strategy):
     """Prompt user for strategy decisions"""
 
+    __slots__ = ()
+
     _GET_BET_PROMPT = "Provide new bet or hit ENTER to use same bet (CTRL-C to quit)"
 
     def show_hand(self, hand: Hand):
         logger.info(hand)
 
     def show_result(self, hand: Hand, result: str):
-        logger.info(f"{hand.name} Result: {result}")
+        logger.info("%s Result: %s", hand.name, result)
 
     def get_bet(self, min_bet: int, bankroll: int) -> Optional[int]:
         logger.info("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-        logger.info(f"Bankroll is ${bankroll}, minimum bet is ${min_bet}")
+        logger.info("Bankroll is $%s, minimum bet is $%s", bankroll, min_bet)
 
         try:
             bet_str = input(f"{self._GET_BET_PROMPT}\n")
@@ -87,41 +122,34 @@ class Manual(Strategy):
                 return bet
 
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         assert actions
         assert not (hand.is_bust() or hand.is_blackjack())
 
-        get_action_prompt = " ".join([str(a) for a in actions])
+        get_action_prompt, valid_inputs = _action_prompt(frozenset(actions))
         while True:
             action_str = input(f"{get_action_prompt}\n").strip().lower()
-            for action in actions:
-                long_form = self._get_action_str_long_form(action)
-                short_form = self._get_action_str_short_form(action)
-                if action_str in [long_form, short_form]:
-                    return action
+            if action_str in valid_inputs:
+                return valid_inputs[action_str]
 
             logger.error("Invalid input, try again")
 
     @staticmethod
     def _get_action_str_long_form(action: Action) -> str:
-        return str(action).lower().replace("[", "").replace("]", "")
-
-    @staticmethod
-    def _get_action_str_short_form(action: Action) -> str:
-        match = re.search(r"\[(.*?)\]", str(action).lower())
-        assert match
-        return match.group(1)
+        return _ACTION_FORMS[action][0]
 
 
 class Training(Manual):
     """Manual strategy with comparison to an automated strategy"""
 
+    __slots__ = ("_other",)
+
     def __init__(self, strategy: Strategy):
         self._other = strategy
 
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         manual = super().get_action(hand, actions, upcard=upcard)
         automated = self._other.get_action(hand, actions, upcard=upcard)
@@ -129,7 +157,7 @@ class Training(Manual):
             logger.info("\u2705 Correct!")
         else:
             automated_str = super()._get_action_str_long_form(automated).title()
-            logger.info(f"\u274c Incorrect! Correct choice: {automated_str}")
+            logger.info("\u274c Incorrect! Correct choice: %s", automated_str)
 
         return manual
 
@@ -137,11 +165,13 @@ class Training(Manual):
 class Dealer(Strategy):
     """Hit until 17, with an option to hit or stand on soft 17"""
 
+    __slots__ = ("_hit_soft_seventeen",)
+
     def __init__(self, hit_soft_seventeen: bool):
         self._hit_soft_seventeen = hit_soft_seventeen
 
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         assert (Action.HIT in actions) and (Action.STAND in actions)
         assert not (hand.is_bust() or hand.is_blackjack())
@@ -157,8 +187,10 @@ class Dealer(Strategy):
 class AlwaysHit(Strategy):
     """YOLO"""
 
+    __slots__ = ()
+
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         assert Action.HIT in actions
         assert not (hand.is_bust() or hand.is_blackjack())
@@ -174,8 +206,10 @@ class Basic(Strategy):
     <https://en.wikipedia.org/wiki/Blackjack#Basic_strategy>
     """
 
+    __slots__ = ()
+
     def get_action(
-        self, hand: Hand, actions: List[Action], upcard: Optional[int] = None
+        self, hand: Hand, actions: Collection[Action], upcard: Optional[int] = None
     ) -> Action:
         assert upcard
         assert not (hand.is_bust() or hand.is_blackjack())
@@ -186,14 +220,19 @@ class Basic(Strategy):
         can_split = Action.SPLIT in actions
 
         if can_split:
-            return self._handle_split(hand[0].value, upcard, can_surrender, can_double)
+            table, player = _SPLIT_TABLE, hand[0].value
         elif (len(hand) == 2) and hand.has_ace():
             other_card = hand[0] if hand[1].is_ace() else hand[1]
-            return self._handle_soft_total(other_card.value, upcard, can_double)
+            table, player = _SOFT_TABLE, other_card.value
         else:
-            return self._handle_hard_total(
-                hand.value(), upcard, can_surrender, can_double
-            )
+            table, player = _HARD_TABLE, hand.value()
+
+        # Inlined _strategy_index(), avoids a call and a tuple key per decision
+        action = table[(player * 48) + (upcard * 4) + (can_surrender * 2) + can_double]
+        if action is None:
+            raise AssertionError("Incomplete strategy")
+
+        return action
 
     @staticmethod
     def _handle_split(
@@ -299,3 +338,51 @@ class Basic(Strategy):
             return Action.HIT
         else:
             raise AssertionError("Incomplete strategy")
+
+
+# Flat table indexed by ``_strategy_index()``, None for inputs with no decision
+_StrategyTable = Tuple[Optional[Action], ...]
+
+
+def _strategy_index(
+    player: int, dealer: int, can_surrender: bool, can_double: bool
+) -> int:
+    # Dealer upcard is at most 11, so each player value spans 12 * 2 * 2 entries
+    return (player * 48) + (dealer * 4) + (can_surrender * 2) + can_double
+
+
+def _make_strategy_table(
+    handler: Callable[[int, int, bool, bool], Action], players: range
+) -> _StrategyTable:
+    """Evaluate a ``Basic`` handler for every input, so decisions are one lookup
+
+    Args:
+        handler: Maps (player, dealer, can_surrender, can_double) to an action
+        players: Player values accepted by the handler, at most 21
+
+    Returns:
+        Table of handler results, without inputs the handler rejects
+    """
+    table: List[Optional[Action]] = [None] * _strategy_index(22, 0, False, False)
+    for player in players:
+        for dealer in range(2, 12):
+            for can_surrender in (False, True):
+                for can_double in (False, True):
+                    key = (player, dealer, can_surrender, can_double)
+                    try:
+                        table[_strategy_index(*key)] = handler(*key)
+                    except AssertionError:
+                        # Impossible hand, e.g. a soft total that is blackjack
+                        pass
+
+    return tuple(table)
+
+
+_SPLIT_TABLE = _make_strategy_table(Basic._handle_split, range(2, 12))
+_SOFT_TABLE = _make_strategy_table(
+    lambda player, dealer, _, can_double: Basic._handle_soft_total(
+        player, dealer, can_double
+    ),
+    range(2, 12),
+)
+_HARD_TABLE = _make_strategy_table(Basic._handle_hard_total, range(4, 22))
@@ -1,14 +1,20 @@
+from functools import cache
+
 from blackjack_sim.core import Card
 
 
+# Cards are immutable, so each factory hands out a single shared instance
+@cache
 def make_ace() -> Card:
-    return Card("Ax", 11)
+    return Card("Ax", 11, 12)
 
 
+@cache
 def make_face_card() -> Card:
-    return Card("Kx", 10)
+    return Card("Kx", 10, 11)
 
 
+@cache
 def make_low_card(num: int) -> Card:
     assert 2 <= num <= 9
-    return Card(f"{num}x", num)
+    return Card(f"{num}x", num, num - 2)
@@ -0,0 +1,18 @@
+import pytest
+from blackjack_sim.strategy import Basic, Dealer
+
+
+# Strategies hold no per-hand state, so one instance serves every test
+@pytest.fixture(scope="session")
+def basic() -> Basic:
+    return Basic()
+
+
+@pytest.fixture(scope="session")
+def dealer_hit() -> Dealer:
+    return Dealer(True)
+
+
+@pytest.fixture(scope="session")
+def dealer_stand() -> Dealer:
+    return Dealer(False)
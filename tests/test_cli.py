@@ -1,7 +1,8 @@
 import logging
 from unittest.mock import patch
 
-from blackjack_sim.cli import app
+from blackjack_sim.cli import PlayerStrategy, app
+from blackjack_sim.strategy import AlwaysHit, Basic
 from typer.testing import CliRunner
 
 runner = CliRunner()
@@ -43,3 +44,28 @@ def test_simulate(caplog):
     assert "Running simulation" in result.output
     assert "Risk of Ruin" in caplog.records[0].getMessage()
     assert "House Edge" in caplog.records[1].getMessage()
+    assert "Hands Played" in caplog.records[2].getMessage()
+
+
+def test_simulate_seeded(caplog):
+    caplog.set_level(logging.INFO)
+    args = ["--bankroll", "100", "simulate", "--num-games", "200", "--seed", "7"]
+
+    messages = []
+    for num_workers in ["1", "2"]:
+        caplog.clear()
+        result = runner.invoke(app, args + ["--num-workers", num_workers])
+        assert result.exit_code == 0
+        messages.append([record.getMessage() for record in caplog.records])
+
+    assert messages[0] == messages[1]
+
+
+def test_simulate_invalid_num_workers():
+    result = runner.invoke(app, ["simulate", "--num-workers", "0"])
+    assert result.exit_code == 2
+
+
+def test_player_strategy_cls():
+    assert PlayerStrategy.Basic.strategy_cls is Basic
+    assert PlayerStrategy.AlwaysHit.strategy_cls is AlwaysHit
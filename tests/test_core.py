@@ -1,4 +1,4 @@
-from blackjack_sim.core import Hand
+from blackjack_sim.core import Card, Hand
 
 from common import make_ace, make_face_card, make_low_card
 
@@ -35,3 +35,80 @@ def test_hand_double():
     hand = Hand([make_low_card(8), make_low_card(2)], wager=10)
     hand.double()
     assert hand.wager == 20
+
+
+def test_hand_aces_count_low():
+    hand = Hand([make_ace(), make_ace(), make_low_card(9)])
+    assert hand.value() == 21
+    assert hand.is_soft()
+
+    hand.append(make_face_card())
+    assert hand.value() == 21
+    assert not hand.is_soft()
+    assert not hand.is_bust()
+
+    hand.append(make_ace())
+    assert hand.value() == 22
+    assert hand.is_bust()
+
+
+def test_hand_reset():
+    hand = Hand([make_ace(), make_face_card()], name="Old", wager=10)
+    hand.double()
+    hand.surrender()
+
+    hand.reset(name="New", wager=5)
+    assert len(hand) == 0
+    assert hand.name == "New"
+    assert hand.wager == 5
+    assert not hand.is_surrender()
+    assert not hand.has_ace()
+    assert hand.value() == 0
+
+    hand.append(make_low_card(9))
+    assert hand.value() == 9
+
+
+def test_hand_list_mutators_keep_value():
+    hand = Hand([make_face_card()])
+    hand.extend([make_low_card(5)])
+    assert hand.value() == 15
+
+    hand = Hand([make_face_card()])
+    hand += [make_ace()]
+    assert hand.value() == 21
+    assert hand.is_blackjack()
+
+    hand = Hand([make_face_card()])
+    hand.insert(0, make_ace())
+    assert hand.value() == 21
+    assert hand.has_ace()
+
+    hand.pop()
+    assert hand.value() == 11
+    assert hand.is_soft()
+
+    hand.remove(make_ace())
+    assert hand.value() == 0
+    assert not hand.has_ace()
+
+    hand = Hand([make_face_card(), make_low_card(9), make_ace()])
+    assert hand.value() == 20
+    hand[1] = make_low_card(2)
+    assert hand.value() == 13
+    del hand[0]
+    assert hand.value() == 13
+    assert hand.is_soft()
+
+    hand *= 2
+    assert len(hand) == 4
+    assert hand.value() == 16
+
+    hand.clear()
+    assert hand.value() == 0
+    assert not hand.has_ace()
+
+
+def test_hand_can_split_same_rank_only():
+    assert Hand([make_face_card(), make_face_card()]).can_split()
+    assert not Hand([make_face_card(), Card("Qx", 10, 10)]).can_split()
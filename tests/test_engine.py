@@ -1,9 +1,11 @@
+import random
 from contextlib import nullcontext
 from unittest.mock import patch, MagicMock
 
 import pytest
 from blackjack_sim.core import Action, Hand
-from blackjack_sim.engine import Game, GameOptions, Shoe
+from blackjack_sim.engine import EmptyShoeError, Game, GameOptions, GameStats, Shoe
+from blackjack_sim.strategy import AlwaysHit, Manual
 
 from common import make_ace, make_face_card, make_low_card
 
@@ -13,11 +15,44 @@ def test_shoe():
     shoe = Shoe(num_decks)
     assert len(shoe) == (52 * num_decks)
     assert shoe.percent_full() == 100.0
+    assert len({id(card) for card in shoe}) == 52
 
     shoe.draw()
     assert shoe.percent_full() < 100.0
 
 
+def test_shoe_empty():
+    shoe = Shoe(1)
+    for _ in range(52):
+        shoe.draw()
+
+    assert shoe.percent_full() == 0.0
+    with pytest.raises(EmptyShoeError):
+        shoe.draw()
+
+
+def test_shoe_shuffle():
+    shoe = Shoe(1)
+    cards = sorted(shoe, key=id)
+    for _ in range(10):
+        shoe.draw()
+
+    shoe.shuffle()
+    assert shoe.percent_full() == 100.0
+    assert sorted(shoe, key=id) == cards
+
+
+def test_shoe_seeded():
+    first = Shoe(2, rng=random.Random(1))
+    second = Shoe(2, rng=random.Random(1))
+    assert list(first) == list(second)
+
+
+def test_game_play_seeded():
+    results = [Game(seed=1).play(AlwaysHit(), 100) for _ in range(2)]
+    assert results[0] == results[1]
+
+
 @pytest.mark.parametrize("allowed", [True, False])
 def test_game_play_hand_late_surrender(allowed: bool):
     strategy = MagicMock()
@@ -36,6 +71,22 @@ def test_game_play_hand_late_surrender(allowed: bool):
             assert hands[0].is_surrender()
 
 
+def test_game_play_hand_hit_until_bust():
+    strategy = MagicMock()
+    strategy.get_action.return_value = Action.HIT
+
+    shoe = MagicMock()
+    shoe.draw.side_effect = [make_low_card(2)] * 4 + [make_face_card()]
+
+    hand = Hand([make_low_card(2), make_low_card(3)])
+    game = Game()
+    game._shoe = shoe
+    hands = game._play_hand(strategy, hand, 10, 0)
+    assert len(hands) == 1
+    assert hands[0].value() == 23
+    assert strategy.get_action.call_count == 5
+
+
 def test_game_play_hand_split():
     strategy = MagicMock()
     strategy.get_action.side_effect = [Action.SPLIT, Action.STAND, Action.STAND]
@@ -66,6 +117,30 @@ def test_game_play_hand_max_split():
         game._play_hand(strategy, hand, 10, options.max_split)
 
 
+@pytest.mark.parametrize("hit_soft_seventeen", [True, False])
+def test_game_play_dealer_soft_seventeen(hit_soft_seventeen: bool):
+    shoe = MagicMock()
+    shoe.draw.side_effect = [make_low_card(2)]
+
+    hand = Hand([make_ace(), make_low_card(6)])
+    game = Game(options=GameOptions(hit_soft_seventeen=hit_soft_seventeen))
+    game._shoe = shoe
+    game._play_dealer(hand)
+    assert hand.value() == (19 if hit_soft_seventeen else 17)
+
+
+def test_game_play_dealer_until_bust():
+    shoe = MagicMock()
+    shoe.draw.side_effect = [make_low_card(2), make_face_card()]
+
+    hand = Hand([make_face_card(), make_low_card(4)])
+    game = Game()
+    game._shoe = shoe
+    game._play_dealer(hand)
+    assert hand.value() == 26
+    assert hand.is_bust()
+
+
 def test_game_compare_hands_player_bust():
     bet = 10
     bankroll = 100
@@ -183,6 +258,21 @@ def test_game_play_round_both_blackjack():
     assert game._bankroll == bet
 
 
+def test_game_play_round_reuses_hands():
+    shoe = MagicMock()
+    shoe.draw.side_effect = [make_ace(), make_ace(), make_face_card()] * 3
+
+    game = Game()
+    game._shoe = shoe
+    game._strategy = MagicMock()
+    game._play_round(10)
+    assert len(game._hand_pool) == 2
+
+    pooled = set(map(id, game._hand_pool))
+    game._play_round(10)
+    assert set(map(id, game._hand_pool)) == pooled
+
+
 @patch("blackjack_sim.engine.Shoe")
 def test_game_play(mock_shoe):
     bet = 10
@@ -204,3 +294,70 @@ def test_game_play(mock_shoe):
     game = Game()
     new_bankroll, ev = game.play(strategy, bankroll)
     assert new_bankroll == (bankroll + bet)
+
+
+@pytest.mark.parametrize("strategy_cls,verbose", [(AlwaysHit, False), (Manual, True)])
+def test_game_play_verbose(strategy_cls, verbose: bool):
+    game = Game()
+    with patch.object(strategy_cls, "get_bet", return_value=None):
+        game.play(strategy_cls(), 100)
+
+    assert game._verbose == verbose
+
+
+def test_game_reset_reuses_shoe():
+    game = Game()
+    game.play(AlwaysHit(), 100)
+    shoe = game._shoe
+
+    game.reset()
+    assert game._shoe is shoe
+    assert shoe and shoe.percent_full() == 100.0
+    assert game._bankroll == 0
+
+
+def test_game_stats():
+    stats = GameStats()
+    assert stats.risk_of_ruin() == 0.0
+    assert stats.mean_ev() == 0.0
+    assert stats.ev_variance() == 0.0
+
+    stats.add(0, -1.0, 4)
+    stats.add(100, 0.5, 10)
+    stats.add(50, 0.5, 6)
+    assert stats.num_games == 3
+    assert stats.num_hands == 20
+    assert stats.risk_of_ruin() == pytest.approx(1 / 3)
+    assert stats.mean_ev() == pytest.approx(0.0)
+    assert stats.ev_variance() == pytest.approx(0.5)
+
+    stats.merge(stats)
+    assert stats.num_games == 6
+    assert stats.num_bankrupt == 2
+    assert stats.num_hands == 40
+    assert stats.ev_variance() == pytest.approx(0.5)
+
+
+@patch.object(Game, "play")
+def test_game_play_many(mock_play):
+    mock_play.side_effect = [(0, -1.0), (20, 1.0)]
+
+    strategy = MagicMock()
+    stats = Game().play_many(strategy, bankroll=10, num_games=2)
+    assert stats.num_games == 2
+    assert stats.num_bankrupt == 1
+    assert stats.mean_ev() == 0.0
+    mock_play.assert_called_with(strategy, 10)
+
+
+def test_game_play_many_counts_hands():
+    stats = Game(seed=1).play_many(AlwaysHit(), bankroll=100, num_games=2)
+
+    # Each game's count starts from zero, it does not carry over
+    game = Game(seed=1)
+    game.play(AlwaysHit(), bankroll=100)
+    first = game._num_hands
+    game.play(AlwaysHit(), bankroll=100)
+    second = game._num_hands
+    assert first and second
+    assert stats.num_hands == first + second
@@ -1,34 +1,55 @@
+from typing import Callable, FrozenSet, Iterable, List, Optional, Tuple
+from unittest.mock import patch
+
+import pytest
 from blackjack_sim.core import Action, Hand
-from blackjack_sim.strategy import AlwaysHit, Basic, Dealer
+from blackjack_sim.strategy import AlwaysHit, Basic, Dealer, Manual
 
 from common import make_ace, make_face_card, make_low_card
 
-_ALL_ACTIONS = list(Action)
-_DEFAULT_ACTIONS = [Action.HIT, Action.STAND]
-_ALL_ACTIONS_NO_SPLIT = [Action.HIT, Action.STAND, Action.SURRENDER, Action.DOUBLE]
-_ALL_ACTIONS_NO_SURRENDER = [Action.HIT, Action.STAND, Action.DOUBLE, Action.SPLIT]
-
-
-def test_dealer():
-    dealer = Dealer(True)
-
+# Same immutable action sets the game engine passes to strategies
+_ALL_ACTIONS = frozenset(Action)
+_DEFAULT_ACTIONS = frozenset([Action.HIT, Action.STAND])
+_ALL_ACTIONS_NO_SPLIT = _ALL_ACTIONS - {Action.SPLIT}
+_ALL_ACTIONS_NO_SURRENDER = _ALL_ACTIONS - {Action.SURRENDER}
+
+# Basic strategy only reads hands, so each test hand is built once and shared
+_PAIR_ACE = Hand([make_ace(), make_ace()])
+_PAIR_TEN = Hand([make_face_card(), make_face_card()])
+_PAIRS = {i: Hand([make_low_card(i), make_low_card(i)]) for i in range(2, 10)}
+_SOFT_HANDS = {i: Hand([make_ace(), make_low_card(i)]) for i in range(2, 10)}
+_HARD_SEVENTEEN_TO_TWENTY = {
+    i: Hand([make_face_card(), make_low_card(5), make_low_card(i)]) for i in range(2, 6)
+}
+_HARD_TWELVE_TO_SIXTEEN = {
+    i: Hand([make_low_card(8), make_low_card(2), make_low_card(i)]) for i in range(2, 7)
+}
+_HARD_FOUR_TO_ELEVEN = {
+    i: Hand([make_low_card(2), make_low_card(i)]) for i in range(2, 10)
+}
+_HARD_SEVENTEEN = Hand([make_face_card(), make_low_card(7)])
+_HARD_SIXTEEN = Hand([make_face_card(), make_low_card(6)])
+_HARD_FIFTEEN = Hand([make_face_card(), make_low_card(5)])
+_HARD_ELEVEN = Hand([make_low_card(7), make_low_card(4)])
+_HARD_TEN = Hand([make_low_card(7), make_low_card(3)])
+_HARD_NINE = Hand([make_low_card(7), make_low_card(2)])
+
+
+def test_dealer(dealer_hit: Dealer):
     hand = Hand([make_low_card(6), make_low_card(2)])
-    assert dealer.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
+    assert dealer_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
 
     hand = Hand([make_ace(), make_low_card(6), make_low_card(2)])
-    assert dealer.get_action(hand, _DEFAULT_ACTIONS) == Action.STAND
+    assert dealer_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.STAND
 
     hand = Hand([make_face_card(), make_face_card()])
-    assert dealer.get_action(hand, _DEFAULT_ACTIONS) == Action.STAND
+    assert dealer_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.STAND
 
     hand = Hand([make_ace(), make_ace()])
-    assert dealer.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
-
+    assert dealer_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
 
-def test_dealer_seventeen():
-    dealer_hit = Dealer(True)
-    dealer_stand = Dealer(False)
 
+def test_dealer_seventeen(dealer_hit: Dealer, dealer_stand: Dealer):
     soft_seventeen = Hand([make_ace(), make_low_card(6)])
     hard_seventeen = Hand([make_face_card(), make_low_card(7)])
 
@@ -39,262 +60,141 @@ def test_dealer_seventeen():
     assert dealer_stand.get_action(hard_seventeen, _DEFAULT_ACTIONS) == Action.STAND
 
 
-def test_player_always_hit():
-    always_hit = AlwaysHit()
-
-    hand = Hand([make_ace(), make_low_card(6)])
-    assert always_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
-
-
-def test_player_basic_split_ace():
-    basic = Basic()
-    hand = Hand([make_ace(), make_ace()])
-    for upcard in range(2, 12):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.SPLIT
+@patch("builtins.input")
+def test_player_manual(mock_input):
+    manual = Manual()
+    hand = Hand([make_low_card(8), make_low_card(8)])
 
+    mock_input.side_effect = ["x", "split", "p"]
+    assert manual.get_action(hand, _ALL_ACTIONS) == Action.SPLIT
+    assert manual.get_action(hand, _ALL_ACTIONS) == Action.SPLIT
 
-def test_player_basic_split_ten():
-    basic = Basic()
-    hand = Hand([make_face_card(), make_face_card()])
-    for upcard in range(2, 12):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.STAND
+    mock_input.side_effect = ["p", " R "]
+    assert manual.get_action(hand, _ALL_ACTIONS_NO_SPLIT) == Action.SURRENDER
 
+    mock_input.side_effect = ["s"]
+    assert manual.get_action(hand, _DEFAULT_ACTIONS) == Action.STAND
+    mock_input.assert_called_with("[H]it [S]tand\n")
 
-def test_player_basic_split_nine():
-    basic = Basic()
-    hand = Hand([make_low_card(9), make_low_card(9)])
-    for upcard in range(2, 12):
-        action = Action.STAND if upcard in [7, 10, 11] else Action.SPLIT
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == action
 
+def test_player_always_hit():
+    always_hit = AlwaysHit()
 
-def test_player_basic_split_eight_no_surrender():
-    basic = Basic()
-    hand = Hand([make_low_card(8), make_low_card(8)])
-    for upcard in range(2, 12):
-        assert (
-            basic.get_action(hand, _ALL_ACTIONS_NO_SURRENDER, upcard=upcard)
-            == Action.SPLIT
-        )
+    hand = Hand([make_ace(), make_low_card(6)])
+    assert always_hit.get_action(hand, _DEFAULT_ACTIONS) == Action.HIT
 
 
-def test_player_basic_split_eight_with_surrender():
-    basic = Basic()
-    hand = Hand([make_low_card(8), make_low_card(8)])
-    assert basic.get_action(hand, _ALL_ACTIONS, upcard=11) == Action.SURRENDER
-
-
-def test_player_basic_split_seven():
-    basic = Basic()
-    hand = Hand([make_low_card(7), make_low_card(7)])
-    for upcard in range(2, 8):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.SPLIT
-
-    for upcard in range(8, 12):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.HIT
-
-
-def test_player_basic_split_six():
-    basic = Basic()
-    hand = Hand([make_low_card(6), make_low_card(6)])
-    for upcard in range(2, 7):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.SPLIT
-
-    for upcard in range(7, 12):
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == Action.HIT
-
-
-def test_player_basic_split_five():
-    basic = Basic()
-    hand = Hand([make_low_card(5), make_low_card(5)])
-    for upcard in range(2, 12):
-        action = Action.DOUBLE if upcard <= 9 else Action.HIT
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == action
-        assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
-
-
-def test_player_basic_split_four():
-    basic = Basic()
-    hand = Hand([make_low_card(4), make_low_card(4)])
-    for upcard in range(2, 12):
-        action = Action.SPLIT if 5 <= upcard <= 6 else Action.HIT
-        assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == action
-
-
-def test_player_basic_split_two_and_three():
-    basic = Basic()
-    for i in range(2, 4):
-        hand = Hand([make_low_card(i), make_low_card(i)])
-        for upcard in range(2, 12):
-            action = Action.SPLIT if upcard <= 7 else Action.HIT
-            assert basic.get_action(hand, _ALL_ACTIONS, upcard=upcard) == action
-
-
-def test_player_basic_soft_nineteen_and_twenty():
-    basic = Basic()
-    for i in range(8, 10):
-        hand = Hand([make_ace(), make_low_card(i)])
-        for upcard in range(2, 12):
-            assert (
-                basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.STAND
-            )
-            if (i == 8) and (upcard == 6):
-                assert (
-                    basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                    == Action.DOUBLE
-                )
-
-
-def test_player_basic_soft_eighteen():
-    basic = Basic()
-    hand = Hand([make_ace(), make_low_card(7)])
-    for upcard in range(2, 12):
-        if 7 <= upcard <= 8:
-            assert (
-                basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.STAND
-            )
-        elif upcard <= 6:
-            assert (
-                basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.STAND
-            )
-            assert (
-                basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                == Action.DOUBLE
-            )
-        else:
-            assert (
-                basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                == Action.HIT
-            )
-
-
-def test_player_basic_soft_seventeen():
-    basic = Basic()
-    hand = Hand([make_ace(), make_low_card(6)])
-    for upcard in range(2, 12):
-        assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
-        if 3 <= upcard <= 6:
-            assert (
-                basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                == Action.DOUBLE
-            )
-
-
-def test_player_basic_soft_fifteen_and_sixteen():
-    basic = Basic()
-    for i in range(4, 6):
-        hand = Hand([make_ace(), make_low_card(i)])
-        for upcard in range(2, 12):
-            assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
-            if 4 <= upcard <= 6:
-                assert (
-                    basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                    == Action.DOUBLE
-                )
-
-
-def test_player_basic_soft_thirteen_and_fourteen():
-    basic = Basic()
-    for i in range(2, 4):
-        hand = Hand([make_ace(), make_low_card(i)])
-        for upcard in range(2, 12):
-            assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
-            if upcard == 6:
-                assert (
-                    basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                    == Action.DOUBLE
-                )
-
-
-def test_player_basic_soft_ace_pair():
-    basic = Basic()
-    hand = Hand([make_ace(), make_ace()])
-    for upcard in range(2, 12):
-        assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
-        if upcard == 6:
-            assert (
-                basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-                == Action.DOUBLE
-            )
-
-
-def test_player_basic_hard_seventeen_to_twenty_no_surrender():
-    basic = Basic()
-    for i in range(2, 6):
-        hand = Hand([make_face_card(), make_low_card(5), make_low_card(i)])
-        for upcard in range(2, 12):
-            assert (
-                basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.STAND
-            )
-
-
-def test_player_basic_hard_seventeen_with_surrender():
-    basic = Basic()
-    hand = Hand([make_face_card(), make_low_card(7)])
-    assert basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=11) == Action.SURRENDER
-
-
-def test_player_basic_hard_twelve_to_sixteen_no_surrender():
-    basic = Basic()
-    for i in range(2, 7):
-        hand = Hand([make_low_card(8), make_low_card(2), make_low_card(i)])
-        for upcard in range(2, 12):
-            if upcard <= 6:
-                action = Action.STAND
-                if (i == 2) and (2 <= upcard <= 3):
-                    action = Action.HIT
-                assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == action
-            else:
-                assert (
-                    basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard)
-                    == Action.HIT
-                )
-
-
-def test_player_basic_hard_sixteen_with_surrender():
-    basic = Basic()
-    hand = Hand([make_face_card(), make_low_card(6)])
-    for upcard in range(9, 12):
-        assert (
-            basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-            == Action.SURRENDER
-        )
-
-
-def test_player_basic_hard_fifteen_with_surrender():
-    basic = Basic()
-    hand = Hand([make_face_card(), make_low_card(5)])
-    for upcard in range(10, 12):
-        assert (
-            basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard)
-            == Action.SURRENDER
-        )
-
-
-def test_player_basic_hard_eleven_with_double():
-    basic = Basic()
-    hand = Hand([make_low_card(7), make_low_card(4)])
-    for upcard in range(2, 12):
-        basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard) == Action.DOUBLE
-
-
-def test_player_basic_hard_ten_with_double():
-    basic = Basic()
-    hand = Hand([make_low_card(7), make_low_card(3)])
-    for upcard in range(2, 10):
-        basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard) == Action.DOUBLE
-
-
-def test_player_basic_hard_nine_with_double():
-    basic = Basic()
-    hand = Hand([make_low_card(7), make_low_card(2)])
-    for upcard in range(3, 7):
-        basic.get_action(hand, _ALL_ACTIONS_NO_SPLIT, upcard=upcard) == Action.DOUBLE
-
-
-def test_player_basic_hard_four_to_eleven_no_double():
-    basic = Basic()
-    for i in range(2, 10):
-        hand = Hand([make_low_card(2), make_low_card(i)])
-        for upcard in range(2, 12):
-            assert basic.get_action(hand, _DEFAULT_ACTIONS, upcard=upcard) == Action.HIT
+_UPCARDS = range(2, 12)
+
+# Basic strategy chart as (hand, upcard, allowed actions, expected action)
+_CHART: List[Tuple[Hand, int, FrozenSet[Action], Action]] = []
+
+# Stable test ids, e.g. "8x+8x-up11-all", instead of pytest's indexed ones
+_CHART_IDS: List[str] = []
+_ALLOWED_NAMES = {
+    _ALL_ACTIONS: "all",
+    _DEFAULT_ACTIONS: "default",
+    _ALL_ACTIONS_NO_SPLIT: "no_split",
+    _ALL_ACTIONS_NO_SURRENDER: "no_surrender",
+}
+
+
+def _add_chart(
+    hand: Hand,
+    allowed: FrozenSet[Action],
+    rule: Callable[[int], Optional[Action]],
+    upcards: Iterable[int] = _UPCARDS,
+):
+    """Add an entry for each upcard the rule gives an expected action for"""
+    for upcard in upcards:
+        expected = rule(upcard)
+        if expected:
+            _CHART.append((hand, upcard, allowed, expected))
+            cards = "+".join(card.name for card in hand)
+            _CHART_IDS.append(f"{cards}-up{upcard}-{_ALLOWED_NAMES[allowed]}")
+
+
+# Pairs
+_add_chart(_PAIR_ACE, _ALL_ACTIONS, lambda u: Action.SPLIT)
+_add_chart(_PAIR_TEN, _ALL_ACTIONS, lambda u: Action.STAND)
+_add_chart(
+    _PAIRS[9],
+    _ALL_ACTIONS,
+    lambda u: Action.STAND if u in [7, 10, 11] else Action.SPLIT,
+)
+_add_chart(_PAIRS[8], _ALL_ACTIONS_NO_SURRENDER, lambda u: Action.SPLIT)
+_add_chart(_PAIRS[8], _ALL_ACTIONS, lambda u: Action.SURRENDER, upcards=[11])
+_add_chart(_PAIRS[7], _ALL_ACTIONS, lambda u: Action.SPLIT if u <= 7 else Action.HIT)
+_add_chart(_PAIRS[6], _ALL_ACTIONS, lambda u: Action.SPLIT if u <= 6 else Action.HIT)
+_add_chart(_PAIRS[5], _ALL_ACTIONS, lambda u: Action.DOUBLE if u <= 9 else Action.HIT)
+_add_chart(_PAIRS[5], _DEFAULT_ACTIONS, lambda u: Action.HIT)
+_add_chart(
+    _PAIRS[4],
+    _ALL_ACTIONS,
+    lambda u: Action.SPLIT if 5 <= u <= 6 else Action.HIT,
+)
+for i in range(2, 4):
+    _add_chart(
+        _PAIRS[i], _ALL_ACTIONS, lambda u: Action.SPLIT if u <= 7 else Action.HIT
+    )
+
+# Soft hands
+for i in range(8, 10):
+    _add_chart(_SOFT_HANDS[i], _DEFAULT_ACTIONS, lambda u: Action.STAND)
+_add_chart(_SOFT_HANDS[8], _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, upcards=[6])
+_add_chart(_SOFT_HANDS[7], _DEFAULT_ACTIONS, lambda u: Action.STAND if u <= 8 else None)
+_add_chart(
+    _SOFT_HANDS[7],
+    _ALL_ACTIONS_NO_SPLIT,
+    lambda u: Action.DOUBLE if u <= 6 else (Action.HIT if u >= 9 else None),
+)
+_add_chart(_SOFT_HANDS[6], _DEFAULT_ACTIONS, lambda u: Action.HIT)
+_add_chart(_SOFT_HANDS[6], _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, range(3, 7))
+for i in range(4, 6):
+    _add_chart(_SOFT_HANDS[i], _DEFAULT_ACTIONS, lambda u: Action.HIT)
+    _add_chart(
+        _SOFT_HANDS[i], _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, range(4, 7)
+    )
+for hand in [_SOFT_HANDS[2], _SOFT_HANDS[3], _PAIR_ACE]:
+    _add_chart(hand, _DEFAULT_ACTIONS, lambda u: Action.HIT)
+    _add_chart(hand, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, upcards=[6])
+
+# Hard hands
+for i in range(2, 6):
+    _add_chart(_HARD_SEVENTEEN_TO_TWENTY[i], _DEFAULT_ACTIONS, lambda u: Action.STAND)
+_add_chart(
+    _HARD_SEVENTEEN, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.SURRENDER, upcards=[11]
+)
+_H, _S = Action.HIT, Action.STAND
+_HARD_TWELVE_TO_SIXTEEN_EXPECTED = {
+    # Upcard: 2   3   4   5   6   7   8   9   T   A
+    2: (_H, _H, _S, _S, _S, _H, _H, _H, _H, _H),
+    3: (_S, _S, _S, _S, _S, _H, _H, _H, _H, _H),
+    4: (_S, _S, _S, _S, _S, _H, _H, _H, _H, _H),
+    5: (_S, _S, _S, _S, _S, _H, _H, _H, _H, _H),
+    6: (_S, _S, _S, _S, _S, _H, _H, _H, _H, _H),
+}
+for i, row in _HARD_TWELVE_TO_SIXTEEN_EXPECTED.items():
+    _add_chart(
+        _HARD_TWELVE_TO_SIXTEEN[i],
+        _DEFAULT_ACTIONS,
+        dict(zip(_UPCARDS, row, strict=True)).get,
+    )
+_add_chart(
+    _HARD_SIXTEEN, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.SURRENDER, range(9, 12)
+)
+_add_chart(
+    _HARD_FIFTEEN, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.SURRENDER, range(10, 12)
+)
+for i in range(2, 10):
+    _add_chart(_HARD_FOUR_TO_ELEVEN[i], _DEFAULT_ACTIONS, lambda u: Action.HIT)
+_add_chart(_HARD_ELEVEN, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE)
+_add_chart(_HARD_TEN, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, range(2, 10))
+_add_chart(_HARD_NINE, _ALL_ACTIONS_NO_SPLIT, lambda u: Action.DOUBLE, range(3, 7))
+
+
+@pytest.mark.parametrize("hand,upcard,allowed,expected", _CHART, ids=_CHART_IDS)
+def test_player_basic_chart(
+    basic: Basic, hand: Hand, upcard: int, allowed: FrozenSet[Action], expected: Action
+):
+    assert basic.get_action(hand, allowed, upcard=upcard) == expected